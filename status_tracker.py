@@ -6,13 +6,73 @@ Monitors the OpenAI Status Page for new incidents, outages, and service updates
 using efficient conditional HTTP requests with ETag support.
 """
 
-import requests
+import aiohttp
+import asyncio
+import hashlib
 import json
-import time
+import logging
+import os
+import random
+import re
 import signal
 import sys
-from datetime import datetime
-from typing import Dict, Set, Optional, List
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, Set, Optional, List
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+try:
+    import ijson
+except ImportError:  # Optional; components are then decoded in one go
+    ijson = None
+
+# Errors raised when a 200 response body is not the JSON we expect
+_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson else (ValueError,)
+
+logger = logging.getLogger(__name__)
+
+
+def _format_timestamp(ts: str) -> str:
+    """Format ISO timestamp to readable format; non-string values are returned unchanged."""
+    if not isinstance(ts, str):
+        return ts
+    return _format_iso_timestamp(ts)
+
+
+@lru_cache(maxsize=1024)
+def _format_iso_timestamp(ts: str) -> str:
+    """Cached worker for _format_timestamp (updated_at values recur across ticks)."""
+    try:
+        if ts.endswith('Z'):
+            ts = ts[:-1] + '+00:00'
+        dt = datetime.fromisoformat(ts)
+        return dt.strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, TypeError):
+        return ts
+
+
+_last_sec = 0
+_last_str = ''
+
+
+def _now_str() -> str:
+    """Current local time as 'YYYY-mm-dd HH:MM:SS', formatted at most once per second."""
+    global _last_sec, _last_str
+    s = int(time.time())
+    if s == _last_sec:
+        return _last_str
+    _last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(s))
+    _last_sec = s
+    return _last_str
 
 
 class StatusTracker:
@@ -26,10 +86,10 @@ class StatusTracker:
             poll_interval: Time in seconds between API checks (default: 60)
         """
         self.poll_interval = poll_interval
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OpenAI-Status-Tracker/1.0'
-        })
+        # The \r progress line only makes sense on a terminal, not in logs
+        self._tty = sys.stdout.isatty()
+        self._progress_shown = False  # A \r progress line is waiting to be overwritten
+        self.session: Optional[aiohttp.ClientSession] = None  # Created in start()
         
         # API endpoints
         self.incidents_url = "https://status.openai.com/api/v2/incidents.json"
@@ -38,222 +98,526 @@ class StatusTracker:
         # State tracking
         self.etag_incidents: Optional[str] = None
         self.etag_components: Optional[str] = None
+        self.last_modified_incidents: Optional[str] = None
+        self.last_modified_components: Optional[str] = None
+        self.cache_expiry_incidents = 0.0  # time.monotonic() until which the cached copy is fresh
+        self.cache_expiry_components = 0.0
+        self._body_hashes: Dict[str, bytes] = {}  # URL -> digest of last body served without an ETag
         self.seen_incident_ids: Set[str] = set()
         self.incident_states: Dict[str, Dict] = {}  # Track incident status changes
         self.component_states: Dict[str, Dict] = {}  # Track component status
+        self._component_index: Dict[str, str] = {}  # Component ID -> name, rebuilt on each 200
+        # (incident ID, updated_at) pairs already processed, as a bounded LRU
+        self._render_cache: "OrderedDict[tuple, None]" = OrderedDict()
+        self._render_cache_size = 4096
+        
+        # Persisted state survives restarts so we resume with 304s and no re-announcements
+        self.state_path = os.environ.get('TRACKER_STATE', '.tracker_state.json')
+        self._last_save = 0.0
+        self._load_state()
         
-        # Graceful shutdown flag
+        # Backoff state for consecutive fetch failures
+        self._backoff = poll_interval
+        self._max_backoff = 15 * 60
+        self._retry_after: Optional[float] = None  # Server-requested minimum delay
+        self._fetch_failed = False  # Set by fetches that neither returned 200 nor 304
+        
+        # Graceful shutdown flag, and the event that wakes sleeps on shutdown
         self.running = True
+        self._stop: Optional[asyncio.Event] = None  # Created in start() on the running loop
         
-    def _make_conditional_request(self, url: str, etag: Optional[str] = None) -> tuple:
+    def _load_state(self):
+        """Restore validators, seen incidents and component names from the state file."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {self.state_path}: {e}")
+            return
+        if not self._is_valid_state(state):
+            logger.warning(f"Ignoring unreadable state file {self.state_path}: unexpected format")
+            return
+        
+        self.etag_incidents = state.get('etag_incidents')
+        self.etag_components = state.get('etag_components')
+        self.last_modified_incidents = state.get('last_modified_incidents')
+        self.last_modified_components = state.get('last_modified_components')
+        self.seen_incident_ids = set(state.get('seen_incident_ids', []))
+        self.incident_states = state.get('incident_states', {})
+        self._component_index = state.get('component_index', {})
+    
+    @staticmethod
+    def _is_valid_state(state) -> bool:
+        """Check that a loaded state file has the shape written by _save_state()."""
+        if not isinstance(state, dict):
+            return False
+        validators = ('etag_incidents', 'etag_components',
+                      'last_modified_incidents', 'last_modified_components')
+        if not all(isinstance(state.get(key), (str, type(None))) for key in validators):
+            return False
+        seen = state.get('seen_incident_ids', [])
+        incident_states = state.get('incident_states', {})
+        component_index = state.get('component_index', {})
+        return (
+            isinstance(seen, list) and all(isinstance(i, str) for i in seen)
+            and isinstance(incident_states, dict)
+            and all(
+                isinstance(entry, dict) and 'status' in entry and 'update_id' in entry
+                for entry in incident_states.values()
+            )
+            and isinstance(component_index, dict)
+        )
+    
+    def _save_state(self):
+        """Write current state to the state file atomically."""
+        state = {
+            'etag_incidents': self.etag_incidents,
+            'etag_components': self.etag_components,
+            'last_modified_incidents': self.last_modified_incidents,
+            'last_modified_components': self.last_modified_components,
+            'seen_incident_ids': sorted(self.seen_incident_ids),
+            'incident_states': self.incident_states,
+            'component_index': self._component_index,
+        }
+        tmp_path = self.state_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            self._last_save = time.monotonic()
+        except OSError as e:
+            self._end_progress_line()
+            logger.warning(f"Could not save state to {self.state_path}: {e}")
+    
+    def _prune_state(self, incidents_data: Dict):
+        """Forget incidents that dropped out of the feed so the saved state stays bounded."""
+        if 'incidents' not in incidents_data:
+            return
+        current_ids = {incident.get('id') for incident in incidents_data['incidents']}
+        self.seen_incident_ids &= current_ids
+        for incident_id in self.incident_states.keys() - current_ids:
+            del self.incident_states[incident_id]
+    
+    def _maybe_save_state(self):
+        """Save state at most once every 5 seconds."""
+        if time.monotonic() - self._last_save > 5:
+            self._save_state()
+    
+    async def _make_conditional_request(self, url: str, etag: Optional[str] = None,
+                                        last_modified: Optional[str] = None,
+                                        decode: Optional[Callable] = None) -> tuple:
         """
-        Make a conditional HTTP request using ETag.
+        Make a conditional HTTP request using ETag and Last-Modified.
         
         Args:
             url: The API endpoint URL
             etag: Previous ETag value for conditional request
+            last_modified: Previous Last-Modified value for conditional request
+            decode: Optional async callable turning a 200 response into data
+                (default: decode the whole JSON body)
             
         Returns:
-            Tuple of (response_data, new_etag, status_code)
-            Returns (None, etag, 304) if not modified
+            Tuple of (response_data, new_etag, status_code, new_last_modified, max_age)
+            Returns (None, etag, 304, last_modified, max_age) if not modified
+            Returns (None, etag, None, last_modified, None) if the request itself failed
         """
-        headers = {}
+        # Only build a headers dict when there is a validator to send
+        headers = None
         if etag:
-            headers['If-None-Match'] = etag
+            # Stored verbatim (quotes and any W/ prefix intact), as RFC 7232 requires
+            headers = {'If-None-Match': etag}
+        if last_modified:
+            headers = headers or {}
+            headers['If-Modified-Since'] = last_modified
             
         try:
-            response = self.session.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 304:
-                # Not modified - no changes
-                return None, etag, 304
-            elif response.status_code == 200:
-                # Content has changed
-                new_etag = response.headers.get('ETag', '').strip('"')
-                data = response.json()
-                return data, new_etag, 200
-            else:
-                print(f"Warning: Unexpected status code {response.status_code} for {url}")
-                return None, etag, response.status_code
+            async with self.session.get(url, headers=headers) as response:
+                max_age = self._parse_max_age(
+                    response.headers.get('Cache-Control'),
+                    response.headers.get('Age')
+                )
+                if response.status == 304:
+                    # Not modified - no changes
+                    return None, etag, 304, last_modified, max_age
+                elif response.status == 200:
+                    # Content has changed
+                    new_etag = response.headers.get('ETag', '')
+                    if new_etag:
+                        # The ETag is authoritative again; a stale digest would mask changes later
+                        self._body_hashes.pop(url, None)
+                    new_last_modified = response.headers.get('Last-Modified')
+                    if decode:
+                        data = await decode(response)
+                    else:
+                        body = await response.read()
+                        if not new_etag:
+                            # Some CDNs drop the ETag: compare a digest of the body instead
+                            digest = hashlib.blake2b(body, digest_size=16).digest()
+                            if self._body_hashes.get(url) == digest:
+                                return None, etag, 304, last_modified, max_age
+                        data = _loads(body)
+                        if not new_etag:
+                            # Only remember bodies that decoded successfully
+                            self._body_hashes[url] = digest
+                    return data, new_etag, 200, new_last_modified, max_age
+                else:
+                    self._end_progress_line()
+                    logger.warning(f"Unexpected status code {response.status} for {url}")
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None:
+                        self._retry_after = max(self._retry_after or 0, retry_after)
+                    return None, etag, response.status, last_modified, None
                 
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching {url}: {e}")
-            return None, etag, None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._end_progress_line()
+            logger.error(f"Error fetching {url}: {e}")
+            return None, etag, None, last_modified, None
+        except _DECODE_ERRORS as e:
+            self._end_progress_line()
+            logger.error(f"Invalid JSON from {url}: {e}")
+            return None, etag, None, last_modified, None
     
-    def _fetch_incidents(self) -> Optional[Dict]:
+    async def _fetch_incidents(self) -> Optional[Dict]:
         """Fetch incidents from the API with conditional request."""
-        data, new_etag, status = self._make_conditional_request(
+        # Cached copy is still fresh per Cache-Control: skip the network entirely
+        if time.monotonic() < self.cache_expiry_incidents:
+            return None
+        
+        data, new_etag, status, last_modified, max_age = await self._make_conditional_request(
             self.incidents_url, 
-            self.etag_incidents
+            self.etag_incidents,
+            self.last_modified_incidents
         )
         
+        if max_age:
+            self.cache_expiry_incidents = time.monotonic() + max_age
+        
         if status == 200:
-            # Update ETag if available, but still return data even without ETag
+            # Update validators if available, but still return data even without them
             if new_etag:
                 self.etag_incidents = new_etag
+            self.last_modified_incidents = last_modified
             return data
         elif status == 304:
             # No changes
             return None
         else:
+            self._fetch_failed = True
             return None
     
-    def _fetch_components(self) -> Optional[Dict]:
-        """Fetch components from the API with conditional request."""
-        data, new_etag, status = self._make_conditional_request(
+    async def _decode_component_index(self, response: aiohttp.ClientResponse) -> Dict[str, str]:
+        """
+        Build the component ID -> name index from a components response.
+        
+        With ijson installed the body is streamed one component at a time,
+        so the full payload is never materialized.
+        """
+        if ijson:
+            components = ijson.items(response.content, 'components.item')
+            return {c['id']: c.get('name', c['id']) async for c in components if 'id' in c}
+        
+        data = _loads(await response.read())
+        return {
+            c['id']: c.get('name', c['id'])
+            for c in data.get('components', []) if 'id' in c
+        }
+    
+    async def _fetch_components(self) -> Optional[Dict[str, str]]:
+        """Fetch components from the API with conditional request and refresh the name index."""
+        # Cached copy is still fresh per Cache-Control: skip the network entirely
+        if time.monotonic() < self.cache_expiry_components:
+            return None
+        
+        data, new_etag, status, last_modified, max_age = await self._make_conditional_request(
             self.components_url,
-            self.etag_components
+            self.etag_components,
+            self.last_modified_components,
+            decode=self._decode_component_index
         )
         
+        if max_age:
+            self.cache_expiry_components = time.monotonic() + max_age
+        
         if status == 200:
-            # Update ETag if available, but still return data even without ETag
+            # Update validators if available, but still return data even without them
             if new_etag:
                 self.etag_components = new_etag
+            self.last_modified_components = last_modified
+            # Keep the previous index if the payload listed no components
+            if data:
+                self._component_index = data
             return data
         elif status == 304:
             # No changes
             return None
         else:
+            self._fetch_failed = True
             return None
     
-    def _get_component_name(self, component_id: str, components_data: Dict) -> str:
-        """Get component name by ID from components data."""
-        if not components_data or 'components' not in components_data:
-            return component_id
-            
-        for component in components_data['components']:
-            if component.get('id') == component_id:
-                return component.get('name', component_id)
-        return component_id
-    
-    def _format_timestamp(self, timestamp: str) -> str:
-        """Format ISO timestamp to readable format."""
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
         try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
-        except:
-            return timestamp
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
+    @staticmethod
+    def _parse_max_age(cache_control: Optional[str], age: Optional[str] = None) -> Optional[int]:
+        """
+        Extract the remaining freshness (in seconds) from Cache-Control max-age.
+        
+        Time the response already spent in an upstream cache (the Age header)
+        is subtracted, floored at 0.
+        """
+        if not cache_control or 'no-cache' in cache_control or 'no-store' in cache_control:
+            return None
+        match = re.search(r'\bmax-age=(\d+)', cache_control)
+        if not match:
+            return None
+        max_age = int(match.group(1))
+        if age and age.strip().isdigit():
+            max_age = max(0, max_age - int(age))
+        return max_age
+    
+    def _next_backoff_delay(self) -> float:
+        """
+        Compute the sleep before retrying after a failed check.
+        
+        Doubles the backoff (capped at 15 minutes) with jitter, and never
+        sleeps less than a Retry-After value sent by the server.
+        """
+        next_backoff = min(self._max_backoff, self._backoff * 2)
+        delay = next_backoff * (0.5 + random.random())
+        if self._retry_after is not None:
+            delay = max(delay, self._retry_after)
+            self._retry_after = None
+        self._backoff = next_backoff
+        return delay
+    
+    @staticmethod
+    def _latest_update_id(incident: Dict) -> str:
+        """Return the ID of the most recent incident update ('' if there is none)."""
+        incident_updates = incident.get('incident_updates')
+        return incident_updates[0].get('id', '') if incident_updates else ''
+    
+    @staticmethod
+    def _referenced_component_ids(incidents_data: Dict) -> Set[str]:
+        """Collect the IDs of all components affected by the given incidents."""
+        ids = set()
+        for incident in incidents_data.get('incidents', []):
+            for comp in incident.get('components', []):
+                comp_id = comp.get('id') if isinstance(comp, dict) else comp
+                if comp_id:
+                    ids.add(comp_id)
+        return ids
     
-    def _print_incident_update(self, incident: Dict, components_data: Optional[Dict] = None):
+    def _get_component_name(self, component_id: str) -> str:
+        """Get component name by ID from the component index."""
+        return self._component_index.get(component_id, component_id)
+    
+    def _build_line(self, incident: Dict) -> tuple:
         """
-        Print formatted incident update to console.
+        Extract the printable fields of an incident.
         
         Args:
             incident: Incident data from API
-            components_data: Optional components data for name resolution
+            
+        Returns:
+            Tuple of (timestamp, component_names, latest_message)
         """
         updated_at = incident.get('updated_at', '')
         
         # Get affected components
-        affected_components = incident.get('components', [])
         component_names = []
-        for comp in affected_components:
+        for comp in incident.get('components', []):
             comp_id = comp.get('id') if isinstance(comp, dict) else comp
-            comp_name = self._get_component_name(comp_id, components_data) if components_data else comp_id
-            component_names.append(comp_name)
+            component_names.append(self._get_component_name(comp_id))
         
-        # Get latest incident update
+        # Get latest incident update (most recent is first)
         incident_updates = incident.get('incident_updates', [])
         latest_message = "No status message available"
         if incident_updates:
-            latest_update = incident_updates[0]  # Most recent is first
-            latest_message = latest_update.get('body', latest_message)
+            latest_message = incident_updates[0].get('body', latest_message)
         
         # Format timestamp
-        timestamp = self._format_timestamp(updated_at) if updated_at else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = _format_timestamp(updated_at) if updated_at else _now_str()
         
-        # Format product names
-        if component_names:
-            product_str = ', '.join(component_names)
-        else:
-            product_str = "OpenAI Services"
-        
-        # Print simplified output
-        print(f"[{timestamp}] Product: {product_str}")
-        print(f"Status: {latest_message}")
-        print()  # Empty line for readability
+        return timestamp, component_names, latest_message
     
-    def _print_status_change(self, incident: Dict, old_status: str, components_data: Optional[Dict] = None):
-        """Print formatted status change update."""
-        updated_at = incident.get('updated_at', '')
+    def _format_event(self, incident: Dict) -> str:
+        """
+        Format a new incident or status change as a console block.
         
-        # Get affected components
-        affected_components = incident.get('components', [])
-        component_names = []
-        for comp in affected_components:
-            comp_id = comp.get('id') if isinstance(comp, dict) else comp
-            comp_name = self._get_component_name(comp_id, components_data) if components_data else comp_id
-            component_names.append(comp_name)
+        Args:
+            incident: Incident data from API
+        """
+        timestamp, component_names, latest_message = self._build_line(incident)
+        product_str = ', '.join(component_names) if component_names else "OpenAI Services"
+        # Empty line after each event for readability
+        return f"[{timestamp}] Product: {product_str}\nStatus: {latest_message}\n\n"
+    
+    def _end_progress_line(self):
+        """Move past the \r progress line so the next output starts on a fresh line."""
+        if self._progress_shown:
+            print()
+            self._progress_shown = False
+    
+    def _report_events(self, events: List[tuple]):
+        """
+        Report a batch of incident events.
         
-        # Get latest update message
-        incident_updates = incident.get('incident_updates', [])
-        latest_message = "No status message available"
-        if incident_updates:
-            latest_update = incident_updates[0]
-            latest_message = latest_update.get('body', latest_message)
+        On a terminal the readable blocks are written in one go; otherwise each
+        event becomes a structured (JSON) log record for downstream ingestion.
         
-        # Format timestamp
-        timestamp = self._format_timestamp(updated_at) if updated_at else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Format product names
-        if component_names:
-            product_str = ', '.join(component_names)
-        else:
-            product_str = "OpenAI Services"
+        Args:
+            events: List of (event_name, incident) tuples
+        """
+        if self._tty:
+            sys.stdout.write(''.join(self._format_event(incident) for _, incident in events))
+            sys.stdout.flush()
+            return
         
-        # Print simplified output
-        print(f"[{timestamp}] Product: {product_str}")
-        print(f"Status: {latest_message}")
-        print()  # Empty line for readability
+        for event, incident in events:
+            _, component_names, latest_message = self._build_line(incident)
+            logger.info(json.dumps({
+                'event': event,
+                'id': incident.get('id'),
+                'status': incident.get('status', 'unknown'),
+                'updated_at': incident.get('updated_at'),
+                'components': component_names,
+                'body': latest_message
+            }))
     
-    def _process_incidents(self, incidents_data: Dict, components_data: Optional[Dict] = None):
+    def _process_incidents(self, incidents_data: Dict):
         """
         Process incidents data and detect new incidents or status changes.
         
         Args:
             incidents_data: Incidents data from API
-            components_data: Optional components data for name resolution
         """
         if not incidents_data or 'incidents' not in incidents_data:
             return
         
-        incidents = incidents_data['incidents']
+        # Hoist attribute lookups out of the loop (matters when backfilling many incidents)
+        seen = self.seen_incident_ids
+        states = self.incident_states
+        add_seen = seen.add
+        # Events are collected and reported once per batch
+        events = []
+        emit = events.append
+        render_cache = self._render_cache
+        render_cache_size = self._render_cache_size
+        latest_update_id = self._latest_update_id
         
-        for incident in incidents:
+        for incident in incidents_data['incidents']:
             incident_id = incident.get('id')
             if not incident_id:
                 continue
             
+            # Skip incidents unchanged since we last processed them
+            key = (incident_id, incident.get('updated_at', ''))
+            if key in render_cache:
+                render_cache.move_to_end(key)
+                continue
+            render_cache[key] = None
+            if len(render_cache) > render_cache_size:
+                render_cache.popitem(last=False)
+            
             current_status = incident.get('status', 'unknown')
+            update_id = latest_update_id(incident)
             
             # Check if this is a new incident
-            if incident_id not in self.seen_incident_ids:
-                self.seen_incident_ids.add(incident_id)
-                self.incident_states[incident_id] = {
+            if incident_id not in seen:
+                add_seen(incident_id)
+                states[incident_id] = {
                     'status': current_status,
+                    'update_id': update_id,
                     'last_updated': incident.get('updated_at', '')
                 }
-                self._print_incident_update(incident, components_data)
+                emit(('incident_new', incident))
             
-            # Check if status has changed
-            elif incident_id in self.incident_states:
-                old_status = self.incident_states[incident_id].get('status')
-                if old_status and old_status != current_status:
-                    self.incident_states[incident_id]['status'] = current_status
-                    self.incident_states[incident_id]['last_updated'] = incident.get('updated_at', '')
-                    self._print_status_change(incident, old_status, components_data)
+            # Check if status changed or a new update was posted
+            else:
+                state = states.get(incident_id)
+                if state is None:
+                    continue
+                if state['status'] == current_status and state['update_id'] == update_id:
+                    continue
+                state['status'] = current_status
+                state['update_id'] = update_id
+                state['last_updated'] = incident.get('updated_at', '')
+                emit(('incident_update', incident))
+        
+        if events:
+            self._report_events(events)
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self):
         """Handle interrupt signals for graceful shutdown."""
-        print("\n\nShutting down gracefully...")
+        if not self.running:
+            return
+        self._end_progress_line()
+        logger.info("Shutting down gracefully...")
         self.running = False
+        # Wake the loop immediately instead of waiting out the current sleep
+        if self._stop:
+            self._stop.set()
     
-    def start(self):
+    async def _sleep(self, delay: float):
+        """Sleep for delay seconds, returning early if shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def start(self):
         """Start monitoring the status page."""
+        self._stop = asyncio.Event()
+        
         # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._signal_handler)
+            except NotImplementedError:
+                # Not supported on Windows; Ctrl+C surfaces as KeyboardInterrupt in main()
+                pass
+        
+        # One keep-alive connection per endpoint, kept open across poll intervals so
+        # each check skips the TCP/TLS handshake. aiohttp already advertises and
+        # decodes gzip/deflate (plus br when Brotli is installed).
+        connector = aiohttp.TCPConnector(
+            limit_per_host=2,
+            keepalive_timeout=self.poll_interval + 15
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'User-Agent': 'OpenAI-Status-Tracker/1.0',
+                'Accept': 'application/json'
+            },
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as self.session:
+            try:
+                await self._run()
+            finally:
+                # Flush once the in-flight check has finished, so nothing it processed is lost
+                self._save_state()
         
+        logger.info("Tracker stopped.")
+    
+    async def _run(self):
+        """Print the banner, populate initial state and run the monitoring loop."""
         print("OpenAI Status Page Tracker")
         print("=" * 70)
         print(f"Monitoring: {self.incidents_url}")
@@ -262,11 +626,21 @@ class StatusTracker:
         print("=" * 70 + "\n")
         
         # Initial fetch to populate state
-        print("Fetching initial status...")
-        incidents_data = self._fetch_incidents()
-        components_data = self._fetch_components()
+        logger.info("Fetching initial status...")
+        incidents_data, _ = await asyncio.gather(
+            self._fetch_incidents(),
+            self._fetch_components()
+        )
         
-        if incidents_data:
+        restored = bool(self.seen_incident_ids)
+        if restored:
+            # Resuming from saved state: only announce what changed while we were down
+            if incidents_data:
+                self._process_incidents(incidents_data)
+                self._prune_state(incidents_data)
+            self._save_state()
+            logger.info(f"Initialized: Restored {len(self.seen_incident_ids)} known incident(s) from {self.state_path}")
+        elif incidents_data:
             # Mark all existing incidents as seen (don't print them on startup)
             if 'incidents' in incidents_data:
                 for incident in incidents_data['incidents']:
@@ -275,53 +649,77 @@ class StatusTracker:
                         self.seen_incident_ids.add(incident_id)
                         self.incident_states[incident_id] = {
                             'status': incident.get('status', 'unknown'),
+                            'update_id': self._latest_update_id(incident),
                             'last_updated': incident.get('updated_at', '')
                         }
-            print(f"Initialized: Found {len(self.seen_incident_ids)} existing incident(s)")
+            self._save_state()
+            logger.info(f"Initialized: Found {len(self.seen_incident_ids)} existing incident(s)")
         else:
-            print("Initialized: No incidents found")
+            logger.info("Initialized: No incidents found")
         
-        print(f"Monitoring for new updates (checking every {self.poll_interval} seconds)...\n")
+        logger.info(f"Monitoring for new updates (checking every {self.poll_interval} seconds)...")
         
         # Main monitoring loop
         check_count = 0
-        while self.running:
+        next_tick = time.monotonic()  # Checks are scheduled against this deadline to avoid drift
+        while not self._stop.is_set():
             try:
                 check_count += 1
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                print(f"[{current_time}] Checking for updates... (check #{check_count})", end='\r')
+                if self._tty:
+                    print(f"[{_now_str()}] Checking for updates... (check #{check_count})", end='\r')
+                    self._progress_shown = True
                 
                 # Fetch incidents with conditional request
-                incidents_data = self._fetch_incidents()
+                self._fetch_failed = False
+                incidents_data = await self._fetch_incidents()
                 
-                # Fetch components (less frequently, but needed for name resolution)
-                if incidents_data:  # Only fetch components if incidents changed
-                    components_data = self._fetch_components()
-                    print()  # New line when changes detected
-                else:
-                    components_data = None
+                if incidents_data:
+                    self._end_progress_line()
+                    
+                    # Components rarely change: only refresh names for unknown IDs
+                    missing = self._referenced_component_ids(incidents_data) - self._component_index.keys()
+                    if missing or not self._component_index:
+                        await self._fetch_components()
                 
                 # Process incidents if data changed
                 if incidents_data:
-                    self._process_incidents(incidents_data, components_data)
+                    self._process_incidents(incidents_data)
+                    self._prune_state(incidents_data)
+                    self._maybe_save_state()
+                
+                # Back off on failure, otherwise resume the normal cadence
+                if self._fetch_failed:
+                    delay = self._next_backoff_delay()
+                    self._end_progress_line()
+                    logger.warning(f"Fetch failed, retrying in {delay:.0f} seconds")
+                    next_tick = time.monotonic() + delay
+                else:
+                    self._backoff = self.poll_interval
+                    next_tick += self.poll_interval
+                    delay = max(0.0, next_tick - time.monotonic())
+                    if delay == 0:
+                        # Fell behind by a whole interval: skip ahead rather than catch up
+                        next_tick = time.monotonic() + self.poll_interval
                 
                 # Wait before next check
-                if self.running:
-                    time.sleep(self.poll_interval)
+                await self._sleep(delay)
                     
-            except KeyboardInterrupt:
-                self._signal_handler(signal.SIGINT, None)
-                break
             except Exception as e:
-                print(f"\nError in monitoring loop: {e}")
-                if self.running:
-                    time.sleep(self.poll_interval)
-        
-        print("\nTracker stopped.")
+                self._end_progress_line()
+                logger.error(f"Error in monitoring loop: {e}")
+                delay = self._next_backoff_delay()
+                next_tick = time.monotonic() + delay
+                await self._sleep(delay)
 
 
 def main():
     """Main entry point."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s %(levelname)s %(message)s',
+        stream=sys.stdout
+    )
+    
     # Default poll interval: 60 seconds
     poll_interval = 60
     
@@ -330,13 +728,17 @@ def main():
         try:
             poll_interval = int(sys.argv[1])
             if poll_interval < 10:
-                print("Warning: Poll interval too short, using minimum of 10 seconds")
+                logger.warning("Poll interval too short, using minimum of 10 seconds")
                 poll_interval = 10
         except ValueError:
-            print(f"Invalid poll interval '{sys.argv[1]}', using default 60 seconds")
+            logger.warning(f"Invalid poll interval '{sys.argv[1]}', using default 60 seconds")
     
     tracker = StatusTracker(poll_interval=poll_interval)
-    tracker.start()
+    try:
+        asyncio.run(tracker.start())
+    except KeyboardInterrupt:
+        logger.info("Tracker stopped.")
+        tracker._save_state()
 
 
 if __name__ == "__main__":